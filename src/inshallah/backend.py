@@ -41,12 +41,9 @@ class Backend:
                 text=True,
             )
             assert proc.stdout is not None
-            while True:
-                line = proc.stdout.readline()
-                if not line and proc.poll() is not None:
-                    break
-                if not line:
-                    continue
+            # readline() blocks until a line or EOF, so read to EOF and then
+            # wait, rather than spinning on poll() while the process exits.
+            for line in iter(proc.stdout.readline, ""):
                 line = line.rstrip("\n")
                 if on_line:
                     on_line(line)
@@ -110,6 +107,10 @@ class CodexBackend(Backend):
 
 def _pi_stream_has_error(line: str) -> bool:
     """Return True when a pi JSON stream line indicates an assistant failure."""
+    # Every failure shape below carries "error" or "aborted"; skip decoding
+    # the (vast majority of) lines that contain neither.
+    if "error" not in line and "aborted" not in line:
+        return False
     try:
         event = json.loads(line)
     except json.JSONDecodeError:
@@ -159,6 +160,8 @@ class OpenCodeBackend(Backend):
 
 def _gemini_stream_has_failure(line: str) -> bool:
     """Return True when a Gemini stream-json result event reports failure."""
+    if '"result"' not in line:
+        return False
     try:
         event = json.loads(line)
     except json.JSONDecodeError:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import heapq
 import io
 import json
 import shutil
@@ -22,7 +24,7 @@ from .dag import DagRunner
 from .events import new_run_id, run_context
 from .fmt import get_formatter
 from .forum_store import ForumStore
-from .issue_store import IssueStore
+from .issue_store import AGENT_TAG, AGENT_TAGS, IssueStore
 from .prompt import list_roles_json
 
 
@@ -36,7 +38,9 @@ def _find_repo_root() -> Path:
     return Path.cwd()
 
 
+@functools.cache
 def _run_parser(prog: str = "inshallah run") -> argparse.ArgumentParser:
+    # parse_args() does not mutate the parser, so one instance per prog is reused.
     p = argparse.ArgumentParser(prog=prog, add_help=False)
     p.add_argument("prompt", nargs="*")
     p.add_argument("--max-steps", type=int, default=20)
@@ -44,8 +48,9 @@ def _run_parser(prog: str = "inshallah run") -> argparse.ArgumentParser:
     return p
 
 
-def _ago(ts: int) -> str:
-    delta = int(time.time()) - ts
+def _ago(ts: int, now: int | None = None) -> str:
+    """Format *ts* relative to *now* (pass *now* when formatting many rows)."""
+    delta = (int(time.time()) if now is None else now) - ts
     if delta < 60:
         return "just now"
     if delta < 3600:
@@ -61,8 +66,9 @@ def _status_style(status: str) -> str:
 
 def _output(data: object, *, pretty: bool = False) -> None:
     indent = 2 if pretty else None
-    json.dump(data, sys.stdout, indent=indent)
-    sys.stdout.write("\n")
+    # json.dump() writes each encoder chunk separately (and never uses the C
+    # encoder); encode the whole document first and write it once.
+    sys.stdout.write(json.dumps(data, indent=indent) + "\n")
 
 
 def _format_recovery(recovery: list[str] | None) -> str:
@@ -249,16 +255,21 @@ def cmd_replay(argv: list[str], console: Console) -> int:
         console.print("[bold]inshallah replay[/bold] - replay a logged run\n")
         console.print("  inshallah replay [dim]<issue-id|path>[/dim] [dim][--backend codex|claude|opencode|pi|gemini][/dim]\n")
         if logs_dir.exists():
-            logs = sorted(logs_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
+            # Stat each log once and keep only the ten newest.
+            logs = heapq.nlargest(
+                10,
+                ((log, log.stat()) for log in logs_dir.glob("*.jsonl")),
+                key=lambda item: item[1].st_mtime,
+            )
             if logs:
                 table = Table(title="Recent Logs", expand=False, show_edge=False, pad_edge=False)
                 table.add_column("ID", style="bold")
                 table.add_column("Size", style="dim", justify="right")
                 table.add_column("Modified", style="dim")
-                for log in logs[:10]:
-                    stat = log.stat()
+                now = int(time.time())
+                for log, stat in logs:
                     size = f"{stat.st_size / 1024:.0f}K"
-                    modified = _ago(int(stat.st_mtime))
+                    modified = _ago(int(stat.st_mtime), now)
                     table.add_row(log.stem, size, modified)
                 console.print(table)
         return 0
@@ -310,13 +321,14 @@ def cmd_resume(argv: list[str], console: Console) -> int:
             table.add_column("Status")
             table.add_column("Title")
             table.add_column("Age", style="dim", justify="right")
+            now = int(time.time())
             for issue in roots[-10:]:
                 style = _status_style(issue["status"])
                 table.add_row(
                     issue["id"],
                     Text(issue["status"], style=style),
                     issue["title"][:50],
-                    _ago(issue.get("created_at", 0)),
+                    _ago(issue.get("created_at", 0), now),
                 )
             console.print(table)
             sample_root = roots[-1]["id"]
@@ -344,9 +356,16 @@ def cmd_resume(argv: list[str], console: Console) -> int:
     p.add_argument("--json", action="store_true")
     args = p.parse_args(argv[1:])
 
-    issue = store.get(issue_id)
+    # One load serves both the exact lookup and the prefix fallback.
+    issue = None
+    candidates: list[dict] = []
+    for candidate in store.list():
+        if candidate["id"] == issue_id:
+            issue = candidate
+            break
+        if candidate["id"].startswith(issue_id):
+            candidates.append(candidate)
     if issue is None:
-        candidates = [candidate for candidate in store.list() if candidate["id"].startswith(issue_id)]
         if len(candidates) == 1:
             issue = candidates[0]
         elif len(candidates) > 1:
@@ -443,15 +462,21 @@ def cmd_status(argv: list[str], console: Console) -> int:
     store = IssueStore.from_workdir(root)
     forum = ForumStore.from_workdir(root)
 
-    roots = store.list(tag="node:root")
-    open_issues = store.list(status="open")
-    ready = store.ready(tags=["node:agent"])
-    topics = forum.topics(prefix="issue:")[:10]
+    # One load and one pass over the issues for both the roots and the open count.
+    roots: list[dict] = []
+    open_count = 0
+    for row in store.list():
+        if "node:root" in row.get("tags", []):
+            roots.append(row)
+        if row["status"] == "open":
+            open_count += 1
+    ready = store.ready(tags=AGENT_TAGS)
+    topics = forum.topics(prefix="issue:", limit=10)
 
     payload = {
         "repo_root": str(root),
         "roots": roots,
-        "open_count": len(open_issues),
+        "open_count": open_count,
         "ready_count": len(ready),
         "ready": ready[:10],
         "recent_topics": topics,
@@ -468,7 +493,7 @@ def cmd_status(argv: list[str], console: Console) -> int:
     summary.add_column("Metric", style="bold")
     summary.add_column("Value")
     summary.add_row("Root issues", str(len(roots)))
-    summary.add_row("Open issues", str(len(open_issues)))
+    summary.add_row("Open issues", str(open_count))
     summary.add_row("Ready issues", str(len(ready)))
     summary.add_row("Roles", str(len(payload["roles"])))
     console.print(summary)
@@ -487,8 +512,9 @@ def cmd_status(argv: list[str], console: Console) -> int:
         ttable.add_column("Topic", style="bold")
         ttable.add_column("Messages", justify="right")
         ttable.add_column("Last", style="dim")
+        now = int(time.time())
         for topic in topics:
-            ttable.add_row(topic["topic"], str(topic["messages"]), _ago(topic["last_at"]))
+            ttable.add_row(topic["topic"], str(topic["messages"]), _ago(topic["last_at"], now))
         console.print(ttable)
 
     if not roots:
@@ -555,7 +581,7 @@ def cmd_run(args: argparse.Namespace, console: Console) -> int:
 
     run_id = new_run_id()
     with run_context(run_id=run_id):
-        root_issue = store.create(prompt_text, tags=["node:agent", "node:root"])
+        root_issue = store.create(prompt_text, tags=[AGENT_TAG, "node:root"])
         if not args.json:
             console.print(
                 Panel(
@@ -662,11 +688,14 @@ def _issues_store() -> IssueStore:
 
 def _resolve_issue_id(store: IssueStore, raw_id: str) -> tuple[str | None, str | None]:
     """Resolve exact or unique prefix issue IDs."""
-    issue = store.get(raw_id)
-    if issue is not None:
-        return issue["id"], None
-
-    matches = [issue["id"] for issue in store.list() if issue["id"].startswith(raw_id)]
+    # One load serves both the exact lookup and the prefix scan.
+    matches: list[str] = []
+    for issue in store.list():
+        issue_id = issue["id"]
+        if issue_id == raw_id:
+            return issue_id, None
+        if issue_id.startswith(raw_id):
+            matches.append(issue_id)
     if not matches:
         return (
             None,
@@ -786,17 +815,16 @@ def _issues_cmd_list(argv: list[str], pretty: bool, console: Console) -> int:
     args = p.parse_args(argv)
 
     store = _issues_store()
-    issues = store.list(status=args.status)
-
-    if args.tag:
-        issues = [issue for issue in issues if all(tag in issue.get("tags", []) for tag in args.tag)]
-
+    root_id = None
     if args.root:
         root_id, err = _resolve_issue_id(store, args.root)
         if err:
             return _error(err)
-        subtree = set(store.subtree_ids(root_id))
-        issues = [issue for issue in issues if issue["id"] in subtree]
+    issues = store.list(status=args.status, root_id=root_id)
+
+    if args.tag:
+        required = frozenset(args.tag)
+        issues = [issue for issue in issues if required.issubset(issue.get("tags", []))]
 
     if args.limit > 0:
         issues = issues[-args.limit:]
@@ -883,8 +911,8 @@ def _issues_cmd_create(argv: list[str], pretty: bool, console: Console) -> int:
         )
 
     tags = list(dict.fromkeys(args.tag))
-    if "node:agent" not in tags:
-        tags.append("node:agent")
+    if AGENT_TAG not in tags:
+        tags.append(AGENT_TAG)
 
     execution_spec = _build_execution_spec(args)
 
@@ -994,8 +1022,9 @@ def _issues_cmd_update(argv: list[str], pretty: bool, console: Console) -> int:
         for tag in args.add_tag:
             if tag not in tags:
                 tags.append(tag)
-        for tag in args.remove_tag:
-            tags = [tag for tag in tags if tag not in args.remove_tag]
+        if args.remove_tag:
+            removed = frozenset(args.remove_tag)
+            tags = [tag for tag in tags if tag not in removed]
         fields["tags"] = tags
 
     routing_touched = any(
@@ -1273,7 +1302,7 @@ def _issues_cmd_ready(argv: list[str], pretty: bool, console: Console) -> int:
         if err:
             return _error(err)
 
-    tags = ["node:agent", *args.tag]
+    tags = AGENT_TAGS.union(args.tag)
     issues = store.ready(root_id, tags=tags)
     _output([_issue_json(issue) for issue in issues], pretty=pretty)
     return 0
@@ -1602,23 +1631,26 @@ _GUIDE_WORKFLOW: list[tuple[str, str, str]] = [
 
 
 def _print_guide_plain(console: Console, section: str) -> None:
-    console.print("inshallah guide")
-    console.print("Mental model and workflow for running inshallah from CLI only.")
+    # Collect the whole guide and print it once rather than line by line.
+    lines = [
+        "inshallah guide",
+        "Mental model and workflow for running inshallah from CLI only.",
+    ]
 
     if section in ("all", "concepts"):
-        console.print("")
-        console.print("Core concepts")
+        lines += ["", "Core concepts"]
         for concept, meaning, signal in _GUIDE_CONCEPTS:
-            console.print(f"- {concept}: {meaning}")
-            console.print(f"  command signal: {signal}")
+            lines.append(f"- {concept}: {meaning}")
+            lines.append(f"  command signal: {signal}")
 
     if section in ("all", "workflow"):
-        console.print("")
-        console.print("End-to-end workflow")
+        lines += ["", "End-to-end workflow"]
         for idx, (step, command, interpretation) in enumerate(_GUIDE_WORKFLOW, start=1):
-            console.print(f"{idx}. {step}")
-            console.print(f"   command: {command}")
-            console.print(f"   interpretation: {interpretation}")
+            lines.append(f"{idx}. {step}")
+            lines.append(f"   command: {command}")
+            lines.append(f"   interpretation: {interpretation}")
+
+    console.print("\n".join(lines))
 
 
 def _print_guide_rich(console: Console, section: str) -> None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,13 +16,13 @@ from rich.text import Text
 from .backend import get_backend
 from .events import EventLog, current_run_id, new_run_id, run_context
 from .fmt import get_formatter
-from .prompt import read_prompt_meta, render
+from .prompt import issue_prompt_text, read_prompt_body, read_prompt_meta, render_text, role_prompt_path
 from .forum_store import ForumStore
-from .issue_store import IssueStore
+from .issue_store import AGENT_TAGS, REORCHESTRATE_OUTCOMES, IssueStore
 from .spec import ExecutionSpec
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DagResult:
     status: str  # "root_final", "no_executable_leaf", "max_steps_exhausted", "error"
     steps: int = 0
@@ -34,6 +35,18 @@ class DagRunner:
     _FALLBACK_MODEL = "gpt-5.3-codex"
     _FALLBACK_REASONING = "xhigh"
 
+    __slots__ = (
+        "store",
+        "forum",
+        "repo_root",
+        "console",
+        "events",
+        "_orchestrator_path",
+        "_logs_dir",
+        "_repo_prefix",
+        "_rich",
+    )
+
     def __init__(
         self,
         store: IssueStore,
@@ -47,14 +60,18 @@ class DagRunner:
         self.repo_root = repo_root
         self.console = console or Console()
         self.events = EventLog.from_repo_root(repo_root)
+        self._orchestrator_path = repo_root / ".inshallah" / "orchestrator.md"
+        self._logs_dir = repo_root / ".inshallah" / "logs"
+        self._repo_prefix = str(repo_root) + os.sep
+        # Terminal capabilities don't change mid-run; probe them once.
+        self._rich = bool(
+            self.console.is_terminal and not self.console.is_dumb_terminal
+        )
 
-    _REORCHESTRATE_OUTCOMES = {"failure", "needs_work"}
-
-    def _rich_output(self) -> bool:
-        return bool(self.console.is_terminal and not self.console.is_dumb_terminal)
+    _REORCHESTRATE_OUTCOMES = REORCHESTRATE_OUTCOMES
 
     def _phase_header(self, title: str, *, subtitle: str = "", style: str = "cyan") -> None:
-        if self._rich_output():
+        if self._rich:
             self.console.print(Rule(f"[bold {style}]{title}[/bold {style}]"))
             if subtitle:
                 self.console.print(Text(subtitle, style="dim"))
@@ -69,6 +86,14 @@ class DagRunner:
     # Routing helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _read_meta(path: Path) -> dict | None:
+        """Read prompt frontmatter, or None if the file does not exist."""
+        try:
+            return read_prompt_meta(path)
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
     def _resolve_config(
         self, issue: dict
     ) -> tuple[str, str, str, str | None]:
@@ -82,9 +107,9 @@ class DagRunner:
         prompt_path: str | None = None
 
         # Tier 1: orchestrator.md frontmatter (global defaults)
-        orchestrator = self.repo_root / ".inshallah" / "orchestrator.md"
-        if orchestrator.exists():
-            meta = read_prompt_meta(orchestrator)
+        orchestrator = self._orchestrator_path
+        meta = self._read_meta(orchestrator)
+        if meta is not None:
             cli = meta.get("cli", cli)
             model = meta.get("model", model)
             reasoning = meta.get("reasoning", reasoning)
@@ -99,9 +124,8 @@ class DagRunner:
 
         # Tier 2: role file frontmatter (role-specific defaults)
         if spec and spec.role:
-            role_path = self.repo_root / ".inshallah" / "roles" / f"{spec.role}.md"
-            if role_path.exists():
-                role_meta = read_prompt_meta(role_path)
+            role_meta = self._read_meta(role_prompt_path(self.repo_root, spec.role))
+            if role_meta is not None:
                 cli = role_meta.get("cli", cli)
                 model = role_meta.get("model", model)
                 reasoning = role_meta.get("reasoning", reasoning)
@@ -119,23 +143,43 @@ class DagRunner:
 
         return cli, model, reasoning, prompt_path
 
+    def _format_path(self, path: Path) -> str:
+        """Return *path* relative to the repo root when it lies inside it."""
+        # Fast path: paths built from repo_root share its string prefix.
+        path_str = str(path)
+        if path_str.startswith(self._repo_prefix):
+            return path_str[len(self._repo_prefix):]
+        try:
+            return str(path.relative_to(self.repo_root))
+        except ValueError:
+            return str(path)
+
     def _render_prompt(
         self, issue: dict, prompt_path: str | None, root_id: str
-    ) -> str:
-        """Render prompt template + inject DAG context."""
-        if prompt_path and Path(prompt_path).exists():
-            rendered = render(prompt_path, issue, repo_root=self.repo_root)
+    ) -> tuple[str, str]:
+        """Render prompt template and the DAG context block.
+
+        Returns (prompt, context); the backend receives ``prompt + context``.
+        """
+        template: str | None = None
+        if prompt_path:
+            # Read directly instead of stat-then-read; only a missing template
+            # falls back to the bare issue text; rendering errors propagate.
+            try:
+                template = read_prompt_body(prompt_path)
+            except (FileNotFoundError, IsADirectoryError):
+                pass
+        if template is None:
+            prompt = issue_prompt_text(issue)
         else:
-            rendered = issue["title"]
-            if issue.get("body"):
-                rendered += "\n\n" + issue["body"]
+            prompt = render_text(template, issue, repo_root=self.repo_root)
 
-        rendered += (
+        context = (
             f"\n\n## Inshallah Context\n"
             f"Root: {root_id}\n"
             f"Assigned issue: {issue['id']}\n"
         )
-        return rendered
+        return prompt, context
 
     def _execute_backend(
         self,
@@ -149,14 +193,14 @@ class DagRunner:
         log_suffix: str = "",
     ) -> tuple[int, float]:
         """Run a backend against the issue. Returns (exit_code, elapsed_seconds)."""
-        rendered = self._render_prompt(issue, prompt_path, root_id)
-
-        prompt_preview = rendered.split("## Inshallah Context", 1)[0].strip()
+        prompt, context = self._render_prompt(issue, prompt_path, root_id)
+        rendered = prompt + context
+        prompt_preview = prompt.strip()
 
         self.console.print(
             f"  [dim]{cli} {model} reasoning={reasoning}[/dim]"
         )
-        if self.console.is_terminal and not self.console.is_dumb_terminal:
+        if self._rich:
             self.console.print(Text("  prompt", style="bold cyan"))
             self.console.print(Markdown(prompt_preview))
         else:
@@ -164,16 +208,13 @@ class DagRunner:
         backend = get_backend(cli)
         formatter = get_formatter(cli, self.console)
 
-        tee_dir = self.repo_root / ".inshallah" / "logs"
-        tee_dir.mkdir(parents=True, exist_ok=True)
+        # Recreated every run: agents may remove it between steps.
+        self._logs_dir.mkdir(parents=True, exist_ok=True)
         suffix = f".{log_suffix}" if log_suffix else ""
-        tee_path = tee_dir / f"{issue['id']}{suffix}.jsonl"
+        tee_path = self._logs_dir / f"{issue['id']}{suffix}.jsonl"
 
-        def _rel(p: Path) -> str:
-            try:
-                return str(p.relative_to(self.repo_root))
-            except ValueError:
-                return str(p)
+        # Shared by the start and end events.
+        tee_rel = self._format_path(tee_path)
 
         self.events.emit(
             "backend.run.start",
@@ -184,7 +225,7 @@ class DagRunner:
                 "model": model,
                 "reasoning": reasoning,
                 "prompt_path": prompt_path,
-                "tee_path": _rel(tee_path),
+                "tee_path": tee_rel,
                 "log_suffix": log_suffix,
             },
         )
@@ -209,7 +250,7 @@ class DagRunner:
                 "cli": cli,
                 "exit_code": exit_code,
                 "elapsed_s": round(elapsed, 3),
-                "tee_path": _rel(tee_path),
+                "tee_path": tee_rel,
                 "log_suffix": log_suffix,
             },
         )
@@ -291,8 +332,8 @@ class DagRunner:
         if not candidates:
             return False
 
-        candidates.sort(key=lambda r: r.get("priority", 3))
-        target = candidates[0]
+        # min() keeps the first of equal priorities, like the stable sort did.
+        target = min(candidates, key=lambda r: r.get("priority", 3))
         target_id = target["id"]
         target_outcome = target.get("outcome")
         self.console.print(
@@ -323,9 +364,6 @@ class DagRunner:
             final: DagResult | None = None
             try:
                 for step in range(max_steps):
-                    # 0. Unstick: failures / needs_work trigger re-orchestration.
-                    self._maybe_unstick(root_id, step + 1)
-
                     # 1. Auto-promote collapsible expanded nodes
                     collapsible = self.store.collapsible(root_id)
                     for node in collapsible:
@@ -342,9 +380,14 @@ class DagRunner:
                         final = DagResult("root_final", steps=step)
                         return final
 
-                    # 3. Select next ready leaf
-                    candidates = self.store.ready(root_id, tags=["node:agent"])
-                    if not candidates:
+                    # Unstick: failures / needs_work trigger re-orchestration.
+                    # Only scan for a reopen target when validation saw one.
+                    if v.needs_reorchestration:
+                        self._maybe_unstick(root_id, step + 1)
+
+                    # 3. Select and claim the next ready leaf in one store pass
+                    issue = self.store.claim_next(root_id, tags=AGENT_TAGS)
+                    if issue is None:
                         # If validation says "in progress" but we have no executable
                         # leaves, try an orchestrator repair pass on the root to
                         # resolve deadlocks / bad expansions.
@@ -430,11 +473,18 @@ class DagRunner:
                         )
                         continue
 
-                    issue = candidates[0]
                     issue_id = issue["id"]
+                    title = issue.get("title", "")
+                    self.events.emit(
+                        "dag.claim",
+                        source="dag_runner",
+                        issue_id=issue_id,
+                        payload={"root_id": root_id, "step": step + 1},
+                    )
+
                     self._phase_header(
                         f"Step {step + 1}",
-                        subtitle=f"{issue_id} {issue['title']}",
+                        subtitle=f"{issue_id} {title}",
                         style="cyan",
                     )
 
@@ -442,17 +492,8 @@ class DagRunner:
                         "dag.step.start",
                         source="dag_runner",
                         issue_id=issue_id,
-                        payload={"root_id": root_id, "step": step + 1, "title": issue.get("title", "")},
-                    )
-
-                    # 3. Claim
-                    self.events.emit(
-                        "dag.claim",
-                        source="dag_runner",
-                        issue_id=issue_id,
-                        payload={"root_id": root_id, "step": step + 1},
+                        payload={"root_id": root_id, "step": step + 1, "title": title},
                     )
-                    self.store.claim(issue_id)
 
                     # 4. Route + 5. Render + 6. Execute
                     cli, model, reasoning, prompt_path = self._resolve_config(issue)
@@ -483,7 +524,7 @@ class DagRunner:
                             {
                                 "step": step + 1,
                                 "issue_id": issue_id,
-                                "title": issue["title"],
+                                "title": title,
                                 "exit_code": exit_code,
                                 "outcome": updated.get("outcome"),
                                 "elapsed_s": round(elapsed, 1),
@@ -8,8 +8,6 @@ This log is intentionally:
 
 from __future__ import annotations
 
-import json
-import os
 import time
 import uuid
 from contextlib import contextmanager
@@ -17,6 +15,8 @@ from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
+from .jsonl import append_rows
+
 EVENT_VERSION = 1
 
 _run_id_var: ContextVar[str | None] = ContextVar("inshallah_run_id", default=None)
@@ -46,6 +46,8 @@ def run_context(*, run_id: str | None) -> Any:
 class EventLog:
     """Append-only JSONL event log."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: Path) -> None:
         self.path = path
 
@@ -53,7 +55,7 @@ class EventLog:
     def from_repo_root(cls, repo_root: Path) -> "EventLog":
         return cls(repo_root / ".inshallah" / "events.jsonl")
 
-    def emit(
+    def build(
         self,
         event_type: str,
         *,
@@ -63,6 +65,7 @@ class EventLog:
         run_id: str | None = None,
         ts_ms: int | None = None,
     ) -> dict[str, Any]:
+        """Build an event envelope without writing it (see ``emit_many``)."""
         if payload is None:
             payload = {}
         if not isinstance(payload, dict):
@@ -80,43 +83,34 @@ class EventLog:
         if issue_id is not None:
             event["issue_id"] = issue_id
         event["payload"] = payload
+        return event
 
-        self._append(event)
+    def emit(
+        self,
+        event_type: str,
+        *,
+        source: str,
+        payload: dict[str, Any] | None = None,
+        issue_id: str | None = None,
+        run_id: str | None = None,
+        ts_ms: int | None = None,
+    ) -> dict[str, Any]:
+        event = self.build(
+            event_type,
+            source=source,
+            payload=payload,
+            issue_id=issue_id,
+            run_id=run_id,
+            ts_ms=ts_ms,
+        )
+        self._append([event])
         return event
 
-    def _append(self, event: dict[str, Any]) -> None:
-        # One os.write() per event line to avoid interleaving when multiple
-        # processes append concurrently.
-        line = json.dumps(event, separators=(",", ":"), ensure_ascii=True) + "\n"
-        data = line.encode("utf-8")
-
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
-        lock_impl = None
-        locked = False
-        try:
-            try:
-                import fcntl  # type: ignore
-
-                lock_impl = fcntl
-            except ImportError:
-                lock_impl = None
-
-            if lock_impl is not None:
-                lock_impl.flock(fd, lock_impl.LOCK_EX)
-                locked = True
-
-            written = 0
-            while written < len(data):
-                n = os.write(fd, data[written:])
-                if n <= 0:
-                    raise OSError("short write while appending event log")
-                written += n
-        finally:
-            if locked and lock_impl is not None:
-                try:
-                    lock_impl.flock(fd, lock_impl.LOCK_UN)
-                except OSError:
-                    pass
-            os.close(fd)
+    def emit_many(self, events: list[dict[str, Any]]) -> None:
+        """Append several built events with a single locked write."""
+        if events:
+            self._append(events)
 
+    def _append(self, events: list[dict[str, Any]]) -> None:
+        # Shared with the stores' appends: one locked O_APPEND write per batch.
+        append_rows(self.path, events)
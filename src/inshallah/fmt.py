@@ -52,6 +52,10 @@ _TOOL_STYLES: dict[str, tuple[set[str], str]] = {
     "execute": ({"bash"}, "yellow"),
     "delegate": ({"task"}, "cyan"),
 }
+# Flattened canonical tool name → style, for a single lookup per tool line.
+_TOOL_STYLE_BY_NAME: dict[str, str] = {
+    tool: style for tools, style in _TOOL_STYLES.values() for tool in tools
+}
 
 
 def _normalize_tool(raw_name: str) -> str:
@@ -71,15 +75,14 @@ def _tool_style(canonical_name: str, *, ok: bool) -> str:
     """Return Rich style string for a tool category."""
     if not ok:
         return "red"
-    for _cat, (tools, style) in _TOOL_STYLES.items():
-        if canonical_name in tools:
-            return style
-    return "dim"
+    return _TOOL_STYLE_BY_NAME.get(canonical_name, "dim")
 
 
 def _strip_shell(cmd: str) -> str:
     """Extract the inner command from /bin/zsh -lc '...' wrappers."""
-    m = _SHELL_WRAP_RE.match(cmd)
+    # Cheap prefix checks first: most commands are neither wrapped nor
+    # cd-prefixed, and an anchored sub() still tries every offset.
+    m = _SHELL_WRAP_RE.match(cmd) if cmd.startswith("/") else None
     if m:
         inner = m.group(1).strip()
         if (inner.startswith("'") and inner.endswith("'")) or (
@@ -87,7 +90,9 @@ def _strip_shell(cmd: str) -> str:
         ):
             inner = inner[1:-1]
         cmd = inner
-    return _CD_PREFIX_RE.sub("", cmd)
+    if cmd.startswith("cd"):
+        cmd = _CD_PREFIX_RE.sub("", cmd, count=1)
+    return cmd
 
 
 def _parse_json_object(raw: object) -> dict:
@@ -108,7 +113,7 @@ def _summarize_shell(cmd: str, max_len: int = 80) -> str:
     raw = raw.replace("\\n", "\n")
     if not raw:
         return ""
-    lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
+    lines = [stripped for ln in raw.splitlines() if (stripped := ln.strip())]
     if lines and lines[0].startswith("set -euo pipefail"):
         lines = lines[1:]
     if not lines:
@@ -119,6 +124,15 @@ def _summarize_shell(cmd: str, max_len: int = 80) -> str:
     return _truncate(head, max_len)
 
 
+def _first_str(params: dict, keys: tuple[str, ...]) -> str:
+    """Return the first non-empty string value among *keys* in *params*."""
+    for key in keys:
+        v = params.get(key)
+        if isinstance(v, str) and v:
+            return v
+    return ""
+
+
 def _truncate(s: str, n: int = 100) -> str:
     return s[: n - 3] + "..." if len(s) > n else s
 
@@ -186,24 +200,14 @@ class _BaseFormatter:
         if not isinstance(params, dict):
             return ""
         if canonical_name in ("read", "glob", "grep"):
-            for key in ("file_path", "filePath", "path", "pattern", "query"):
-                v = params.get(key)
-                if isinstance(v, str) and v:
-                    return v
+            return _first_str(params, ("file_path", "filePath", "path", "pattern", "query"))
         elif canonical_name in ("edit", "write"):
-            for key in ("file_path", "filePath", "path"):
-                v = params.get(key)
-                if isinstance(v, str) and v:
-                    return v
+            return _first_str(params, ("file_path", "filePath", "path"))
         elif canonical_name == "bash":
-            for key in ("command", "cmd"):
-                v = params.get(key)
-                if isinstance(v, str) and v:
-                    return _summarize_shell(v, 80)
+            cmd = _first_str(params, ("command", "cmd"))
+            return _summarize_shell(cmd, 80) if cmd else ""
         elif canonical_name == "task":
-            v = params.get("description")
-            if isinstance(v, str) and v:
-                return v
+            return _first_str(params, ("description",))
         else:
             for v in params.values():
                 if isinstance(v, str) and v:
@@ -214,9 +218,6 @@ class _BaseFormatter:
         """Print a single-line tool invocation with success/failure indicator."""
         self._close_live_delta()
         prefix = "\u2713" if ok else "\u2717"
-        line = f"  {prefix} {name}"
-        if detail:
-            line += f" {detail}"
         if self.interactive:
             tool_style = _tool_style(name, ok=ok)
             text = Text("  ")
@@ -228,6 +229,7 @@ class _BaseFormatter:
                 text.append(detail, style="dim" if ok else "red")
             self.console.print(text)
         else:
+            line = f"  {prefix} {name} {detail}" if detail else f"  {prefix} {name}"
             self.console.print(line, markup=False)
 
     def _buffer_tool(self, name: str, detail: str = "") -> None:
@@ -419,8 +421,7 @@ class ClaudeFormatter(_BaseFormatter):
             self._active_tool_json_parts = []
 
     def process_line(self, line: str) -> None:
-        if not line.strip():
-            return
+        # Blank lines fail to decode too, so no separate strip() copy.
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -564,8 +565,6 @@ class CodexFormatter(_BaseFormatter):
         self._resolve_tool(ok=ok)
 
     def process_line(self, line: str) -> None:
-        if not line.strip():
-            return
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -639,8 +638,6 @@ class OpenCodeFormatter(_BaseFormatter):
         super().__init__("opencode", console)
 
     def process_line(self, line: str) -> None:
-        if not line.strip():
-            return
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -694,8 +691,6 @@ class GeminiFormatter(_BaseFormatter):
         super().__init__("gemini", console)
 
     def process_line(self, line: str) -> None:
-        if not line.strip():
-            return
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -759,8 +754,6 @@ class PiFormatter(_BaseFormatter):
         super().__init__("pi", console)
 
     def process_line(self, line: str) -> None:
-        if not line.strip():
-            return
         try:
             event = json.loads(line)
         except json.JSONDecodeError:
@@ -777,8 +770,7 @@ class PiFormatter(_BaseFormatter):
             self._buffer_tool(canonical, detail)
 
         elif etype == "tool_execution_end":
-            is_error = bool(event.get("isError"))
-            self._resolve_tool(ok=not is_error)
+            self._resolve_tool(ok=not event.get("isError"))
 
         elif etype == "message_update":
             assistant_event = event.get("assistantMessageEvent", {})
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import heapq
+import json
+from collections import deque
 from pathlib import Path
 
 from .events import EventLog
-from .jsonl import now_ts, read_jsonl, write_jsonl
+from .jsonl import append_jsonl, now_ts, read_jsonl
+
+# Topics of the form "issue:<id>" are attributed to that issue in events.
+_ISSUE_TOPIC_PREFIX = "issue:"
+_ISSUE_TOPIC_PREFIX_LEN = len(_ISSUE_TOPIC_PREFIX)
+
+
+def _topic_recency(entry: dict) -> tuple[int, str]:
+    return entry["last_at"], entry["topic"]
 
 
 class ForumStore:
     """JSONL-backed message forum stored in .inshallah/forum.jsonl."""
 
+    __slots__ = ("path", "events")
+
     def __init__(self, path: Path) -> None:
         self.path = path
         self.events = EventLog(path.parent / "events.jsonl")
@@ -22,8 +35,8 @@ class ForumStore:
 
     def post(self, topic: str, body: str, author: str = "system") -> dict:
         issue_id: str | None = None
-        if topic.startswith("issue:") and len(topic.split(":", 1)) == 2:
-            candidate = topic.split(":", 1)[1].strip()
+        if topic.startswith(_ISSUE_TOPIC_PREFIX):
+            candidate = topic[_ISSUE_TOPIC_PREFIX_LEN:].strip()
             if candidate:
                 issue_id = candidate
 
@@ -33,9 +46,8 @@ class ForumStore:
             "author": author,
             "created_at": now_ts(),
         }
-        rows = read_jsonl(self.path)
-        rows.append(msg)
-        write_jsonl(self.path, rows)
+        # Posts are append-only: never re-read or rewrite the whole forum.
+        append_jsonl(self.path, msg)
         self.events.emit(
             "forum.post",
             source="forum_store",
@@ -45,12 +57,21 @@ class ForumStore:
         return msg
 
     def read(self, topic: str, limit: int = 50) -> list[dict]:
-        rows = read_jsonl(self.path)
-        matching = [row for row in rows if row["topic"] == topic]
-        return matching[-limit:]
+        # Only decode lines that contain the topic as a JSON string.
+        rows = read_jsonl(self.path, contains=json.dumps(topic))
+        matching = (row for row in rows if row["topic"] == topic)
+        if limit > 0:
+            # Keep only the newest ``limit`` matches while scanning instead
+            # of collecting every match and slicing the tail.
+            return list(deque(matching, maxlen=limit))
+        return list(matching)[-limit:]
+
+    def topics(self, prefix: str | None = None, limit: int | None = None) -> list[dict]:
+        """Return topic metadata sorted by most-recent activity.
 
-    def topics(self, prefix: str | None = None) -> list[dict]:
-        """Return topic metadata sorted by most-recent activity."""
+        With *limit*, only the ``limit`` most recent topics are selected,
+        without sorting the rest.
+        """
         rows = read_jsonl(self.path)
         by_topic: dict[str, dict] = {}
         for row in rows:
@@ -59,11 +80,15 @@ class ForumStore:
                 continue
             if prefix and not topic.startswith(prefix):
                 continue
-            entry = by_topic.setdefault(topic, {"topic": topic, "messages": 0, "last_at": 0})
+            created_at = int(row.get("created_at", 0))
+            entry = by_topic.get(topic)
+            if entry is None:
+                # setdefault() would build a throwaway default dict per row.
+                by_topic[topic] = {"topic": topic, "messages": 1, "last_at": max(0, created_at)}
+                continue
             entry["messages"] += 1
-            entry["last_at"] = max(entry["last_at"], int(row.get("created_at", 0)))
-        return sorted(
-            by_topic.values(),
-            key=lambda item: (item["last_at"], item["topic"]),
-            reverse=True,
-        )
+            if created_at > entry["last_at"]:
+                entry["last_at"] = created_at
+        if limit is not None:
+            return heapq.nlargest(limit, by_topic.values(), key=_topic_recency)
+        return sorted(by_topic.values(), key=_topic_recency, reverse=True)
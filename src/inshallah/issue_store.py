@@ -3,23 +3,38 @@
 from __future__ import annotations
 
 from collections import deque
+from collections.abc import Collection
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from .events import EventLog
-from .jsonl import now_ts, read_jsonl, short_id, write_jsonl
+from .jsonl import append_rows, now_ts, read_jsonl, short_id, write_jsonl
 
+# Tag marking issues an agent can execute; the runner's default ready filter.
+AGENT_TAG = "node:agent"
+AGENT_TAGS = frozenset({AGENT_TAG})
 
-@dataclass(frozen=True)
+# Closed outcomes that hand the issue back to the orchestrator.
+REORCHESTRATE_OUTCOMES = frozenset({"failure", "needs_work"})
+# Closed outcomes that let an expanded parent collapse to success.
+TERMINAL_OUTCOMES = frozenset({"success", "skipped"})
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     is_final: bool
     reason: str
+    # True when a closed node awaits re-orchestration (failure / needs_work,
+    # or expanded without children).
+    needs_reorchestration: bool = False
 
 
 class IssueStore:
     """JSONL-backed issue tracker stored in .inshallah/issues.jsonl."""
 
+    __slots__ = ("path", "events")
+
     def __init__(self, path: Path) -> None:
         self.path = path
         self.events = EventLog(path.parent / "events.jsonl")
@@ -35,6 +50,9 @@ class IssueStore:
     def _save(self, rows: list[dict]) -> None:
         write_jsonl(self.path, rows)
 
+    def _append(self, row: dict) -> None:
+        append_rows(self.path, [row])
+
     def _find(self, rows: list[dict], issue_id: str) -> dict | None:
         for row in rows:
             if row["id"] == issue_id:
@@ -64,9 +82,9 @@ class IssueStore:
             "created_at": now,
             "updated_at": now,
         }
-        rows = self._load()
-        rows.append(issue)
-        self._save(rows)
+        # A new issue touches no existing row, so append instead of
+        # re-reading and rewriting the whole store.
+        self._append(issue)
         self.events.emit(
             "issue.create",
             source="issue_store",
@@ -83,69 +101,84 @@ class IssueStore:
         *,
         status: str | None = None,
         tag: str | None = None,
+        root_id: str | None = None,
     ) -> list[dict]:
         rows = self._load()
-        if status:
-            rows = [row for row in rows if row["status"] == status]
-        if tag:
-            rows = [row for row in rows if tag in row.get("tags", [])]
-        return rows
+        if not status and not tag and not root_id:
+            return rows
+        # The subtree is computed from the rows already loaded.
+        subtree = set(self._subtree_ids(rows, root_id)) if root_id else None
+        return [
+            row
+            for row in rows
+            if (not status or row["status"] == status)
+            and (not tag or tag in row.get("tags", []))
+            and (subtree is None or row["id"] in subtree)
+        ]
 
     def update(self, issue_id: str, **fields: Any) -> dict:
         rows = self._load()
         issue = self._find(rows, issue_id)
         if issue is None:
             raise KeyError(issue_id)
-        before = dict(issue)
-        for key, value in fields.items():
-            if key == "id":
-                continue
-            issue[key] = value
+        # The id is immutable; drop it once and reuse the filtered fields.
+        updates = {key: value for key, value in fields.items() if key != "id"}
+        # Only the touched fields (and status, for lifecycle events) are
+        # compared afterwards, so snapshot just those instead of the whole row.
+        before = {key: issue.get(key) for key in (*updates, "status")}
+        issue.update(updates)
         issue["updated_at"] = now_ts()
         self._save(rows)
-        after = dict(issue)
 
         changed: dict[str, dict[str, Any]] = {}
-        for key, value in fields.items():
-            if key == "id":
-                continue
-            if before.get(key) != after.get(key):
-                changed[key] = {"from": before.get(key), "to": after.get(key)}
-
-        self.events.emit(
-            "issue.update",
-            source="issue_store",
-            issue_id=issue_id,
-            payload={"changed": changed, "fields": {k: v for k, v in fields.items() if k != "id"}},
-        )
+        for key in updates:
+            if before.get(key) != issue.get(key):
+                changed[key] = {"from": before.get(key), "to": issue.get(key)}
+
+        # The update and its lifecycle event go out in one event-log write.
+        events = [
+            self.events.build(
+                "issue.update",
+                source="issue_store",
+                issue_id=issue_id,
+                payload={"changed": changed, "fields": updates},
+            )
+        ]
 
-        if before.get("status") != after.get("status"):
-            status = after.get("status")
+        if before.get("status") != issue.get("status"):
+            status = issue.get("status")
             if status == "open":
-                self.events.emit(
-                    "issue.open",
-                    source="issue_store",
-                    issue_id=issue_id,
-                    payload={"from": before.get("status"), "to": status},
+                events.append(
+                    self.events.build(
+                        "issue.open",
+                        source="issue_store",
+                        issue_id=issue_id,
+                        payload={"from": before.get("status"), "to": status},
+                    )
                 )
             elif status == "closed":
-                self.events.emit(
-                    "issue.close",
-                    source="issue_store",
-                    issue_id=issue_id,
-                    payload={
-                        "from": before.get("status"),
-                        "to": status,
-                        "outcome": after.get("outcome"),
-                    },
+                events.append(
+                    self.events.build(
+                        "issue.close",
+                        source="issue_store",
+                        issue_id=issue_id,
+                        payload={
+                            "from": before.get("status"),
+                            "to": status,
+                            "outcome": issue.get("outcome"),
+                        },
+                    )
                 )
             elif status == "in_progress":
-                self.events.emit(
-                    "issue.claim",
-                    source="issue_store",
-                    issue_id=issue_id,
-                    payload={"from": before.get("status"), "to": status, "ok": True},
+                events.append(
+                    self.events.build(
+                        "issue.claim",
+                        source="issue_store",
+                        issue_id=issue_id,
+                        payload={"from": before.get("status"), "to": status, "ok": True},
+                    )
                 )
+        self.events.emit_many(events)
         return issue
 
     def claim(self, issue_id: str) -> bool:
@@ -178,18 +211,43 @@ class IssueStore:
         )
         return True
 
+    def claim_next(
+        self,
+        root_id: str | None = None,
+        *,
+        tags: Collection[str] | None = None,
+    ) -> dict | None:
+        """Claim the first ready issue in one load/save. Returns None if none are ready."""
+        rows = self._load()
+        candidates = self._ready(rows, root_id, tags)
+        if not candidates:
+            return None
+        issue = candidates[0]
+        issue["status"] = "in_progress"
+        issue["updated_at"] = now_ts()
+        self._save(rows)
+        self.events.emit(
+            "issue.claim",
+            source="issue_store",
+            issue_id=issue["id"],
+            payload={"ok": True},
+        )
+        return issue
+
     def close(self, issue_id: str, outcome: str = "success") -> dict:
         return self.update(issue_id, status="closed", outcome=outcome)
 
     def reset_in_progress(self, root_id: str) -> list[str]:
         """Reset all in_progress issues in the subtree back to open. Returns reset ids."""
         rows = self._load()
-        ids_in_scope = set(self.subtree_ids(root_id))
+        ids_in_scope = set(self._subtree_ids(rows, root_id))
         reset: list[str] = []
+        # One timestamp for the whole batch; every reset lands in one write.
+        now = now_ts()
         for row in rows:
             if row["id"] in ids_in_scope and row["status"] == "in_progress":
                 row["status"] = "open"
-                row["updated_at"] = now_ts()
+                row["updated_at"] = now
                 reset.append(row["id"])
         if reset:
             self._save(rows)
@@ -249,7 +307,10 @@ class IssueStore:
 
     def subtree_ids(self, root_id: str) -> list[str]:
         """BFS from root_id via parent deps. Returns all descendant ids including root."""
-        rows = self._load()
+        return self._subtree_ids(self._load(), root_id)
+
+    @staticmethod
+    def _subtree_ids(rows: list[dict], root_id: str) -> list[str]:
         children_of: dict[str, list[str]] = {}
         for row in rows:
             for dep in row.get("deps", []):
@@ -273,51 +334,58 @@ class IssueStore:
         self,
         root_id: str | None = None,
         *,
-        tags: list[str] | None = None,
+        tags: Collection[str] | None = None,
     ) -> list[dict]:
         """Return open, unblocked leaf issues in the subtree, optionally filtered by tags."""
-        rows = self._load()
-        by_id = {row["id"]: row for row in rows}
+        return self._ready(self._load(), root_id, tags)
 
+    def _ready(
+        self,
+        rows: list[dict],
+        root_id: str | None,
+        tags: Collection[str] | None,
+    ) -> list[dict]:
+        # Normalize the tag filter once rather than per candidate row.
+        required_tags = frozenset(tags) if tags else frozenset()
         if root_id:
-            ids_in_scope = set(self.subtree_ids(root_id))
+            ids_in_scope = set(self._subtree_ids(rows, root_id))
         else:
-            ids_in_scope = set(by_id.keys())
+            ids_in_scope = {row["id"] for row in rows}
 
+        # One pass over the edges: blockers, and parents with unfinished
+        # children (which are not leaves yet).
         blocked: set[str] = set()
+        has_open_child: set[str] = set()
         for row in rows:
-            for dep in row.get("deps", []):
-                if dep["type"] == "blocks" and (
-                    row["status"] != "closed"
-                    or row.get("outcome") == "expanded"
-                ):
-                    blocked.add(dep["target"])
-
-        result = []
-        for issue_id in ids_in_scope:
-            row = by_id.get(issue_id)
-            if row is None or row["status"] != "open":
+            deps = row.get("deps")
+            if not deps:
                 continue
-            if issue_id in blocked:
+            # Per-row facts, evaluated once rather than per edge.
+            unfinished = row["status"] != "closed"
+            blocks = unfinished or row.get("outcome") == "expanded"
+            for dep in deps:
+                if dep["type"] == "blocks":
+                    if blocks:
+                        blocked.add(dep["target"])
+                elif dep["type"] == "parent" and unfinished:
+                    has_open_child.add(dep["target"])
+
+        # (priority, position, row): ties keep store (creation) order, and the
+        # keys are built once instead of via a per-row key function.
+        keyed: list[tuple[int, int, dict]] = []
+        for position, row in enumerate(rows):
+            issue_id = row["id"]
+            if issue_id not in ids_in_scope or row["status"] != "open":
                 continue
-
-            children = [
-                child
-                for child in rows
-                if any(
-                    dep["type"] == "parent" and dep["target"] == issue_id
-                    for dep in child.get("deps", [])
-                )
-            ]
-            if any(child["status"] != "closed" for child in children):
+            if issue_id in blocked or issue_id in has_open_child:
                 continue
 
-            if tags and not all(tag in row.get("tags", []) for tag in tags):
+            if required_tags and not required_tags.issubset(row.get("tags", [])):
                 continue
-            result.append(row)
+            keyed.append((row.get("priority", 3), position, row))
 
-        result.sort(key=lambda row: row.get("priority", 3))
-        return result
+        keyed.sort()
+        return [row for _, _, row in keyed]
 
     def collapsible(self, root_id: str) -> list[dict]:
         """Return expanded issues whose children are all terminally closed.
@@ -334,7 +402,7 @@ class IssueStore:
         """
         rows = self._load()
         by_id = {row["id"]: row for row in rows}
-        ids_in_scope = set(self.subtree_ids(root_id))
+        ids_in_scope = set(self._subtree_ids(rows, root_id))
 
         # Build parent→children mapping
         children_of: dict[str, list[dict]] = {}
@@ -345,7 +413,6 @@ class IssueStore:
 
         # Collapse is only valid when children "passed" the work. Failures and
         # needs_work are handled by re-orchestration, not collapse.
-        terminal_outcomes = {"success", "skipped"}
         result: list[dict] = []
 
         for issue_id in ids_in_scope:
@@ -359,7 +426,7 @@ class IssueStore:
                 continue
             if all(
                 kid["status"] == "closed"
-                and kid.get("outcome") in terminal_outcomes
+                and kid.get("outcome") in TERMINAL_OUTCOMES
                 for kid in kids
             ):
                 result.append(node)
@@ -383,7 +450,7 @@ class IssueStore:
         """
         rows = self._load()
         by_id = {row["id"]: row for row in rows}
-        ids = set(self.subtree_ids(root_id))
+        ids = set(self._subtree_ids(rows, root_id))
 
         root = by_id.get(root_id)
         if root is None:
@@ -397,53 +464,43 @@ class IssueStore:
                 if dep["type"] == "parent":
                     children_of.setdefault(dep["target"], []).append(row["id"])
 
-        # Closed failures / needs_work are not final: they require the
-        # orchestrator to re-expand and create new leaf work.
-        needs_reorch = sorted(
-            [
-                issue_id
-                for issue_id in ids
-                if by_id.get(issue_id, {}).get("status") == "closed"
-                and by_id.get(issue_id, {}).get("outcome")
-                in {"failure", "needs_work"}
-            ]
-        )
+        # Classify the subtree in one pass:
+        # - closed failures / needs_work are not final: they require the
+        #   orchestrator to re-expand and create new leaf work;
+        # - "expanded" without children is a structural bug: there is no leaf
+        #   work remaining, but the DAG can't converge without re-orchestration;
+        # - every non-closed issue is still pending.  Expanded nodes are
+        #   transparent — they delegated to children and are not themselves
+        #   "pending."
+        needs_reorch: list[str] = []
+        bad_expanded: list[str] = []
+        pending: list[str] = []
+        for issue_id in ids:
+            row = by_id.get(issue_id)
+            if row is None:
+                continue
+            if row["status"] != "closed":
+                pending.append(issue_id)
+                continue
+            outcome = row.get("outcome")
+            if outcome in REORCHESTRATE_OUTCOMES:
+                needs_reorch.append(issue_id)
+            elif outcome == "expanded" and not children_of.get(issue_id):
+                bad_expanded.append(issue_id)
+
         if needs_reorch:
             return ValidationResult(
-                is_final=False, reason=f"needs work: {','.join(needs_reorch)}"
+                is_final=False,
+                reason=f"needs work: {','.join(sorted(needs_reorch))}",
+                needs_reorchestration=True,
             )
-
-        # "expanded" without children is a structural bug: there is no leaf
-        # work remaining, but the DAG can't converge without re-orchestration.
-        bad_expanded = sorted(
-            [
-                issue_id
-                for issue_id in ids
-                if by_id.get(issue_id, {}).get("status") == "closed"
-                and by_id.get(issue_id, {}).get("outcome") == "expanded"
-                and not children_of.get(issue_id)
-            ]
-        )
         if bad_expanded:
             return ValidationResult(
                 is_final=False,
-                reason=f"expanded without children: {','.join(bad_expanded)}",
+                reason=f"expanded without children: {','.join(sorted(bad_expanded))}",
+                needs_reorchestration=True,
             )
 
-        # Collect issues that still need work.  Expanded nodes are
-        # transparent — they delegated to children and are not themselves
-        # "pending."  Every other non-closed issue counts as pending.
-        pending = [
-            issue_id
-            for issue_id in ids
-            if issue_id in by_id
-            and not (
-                by_id[issue_id]["status"] == "closed"
-                and by_id[issue_id].get("outcome") == "expanded"
-            )
-            and by_id[issue_id]["status"] != "closed"
-        ]
-
         if not pending:
             return ValidationResult(is_final=True, reason="all work completed")
 
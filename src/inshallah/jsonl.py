@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
+import stat
+import tempfile
 import time
 import uuid
 from pathlib import Path
 
+# json.dumps() builds a new JSONEncoder whenever non-default options are
+# passed, so keep one compact encoder for every row we write.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def encode_row(row: dict) -> str:
+    """Serialize one row as compact JSON (no trailing newline)."""
+    return _ENCODER.encode(row)
+
 
 def short_id() -> str:
     return uuid.uuid4().hex[:8]
@@ -17,22 +29,92 @@ def now_ts() -> int:
     return int(time.time())
 
 
-def read_jsonl(path: Path) -> list[dict]:
-    if not path.exists():
+def read_jsonl(path: Path, *, contains: str | None = None) -> list[dict]:
+    """Read every row, or with *contains* only rows whose line includes it.
+
+    *contains* is a plain substring prefilter applied before decoding, so
+    callers must still check the decoded row.
+    """
+    try:
+        text = path.read_text()
+    except FileNotFoundError:
         return []
-    rows: list[dict] = []
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                rows.append(json.loads(line))
-    return rows
+    if contains is None:
+        lines = [line for line in text.split("\n") if line.strip()]
+    else:
+        lines = [line for line in text.split("\n") if contains in line]
+    # Each line is decoded on its own: a batched decode of the joined lines
+    # can accept corrupt stores (split rows, several values on one line).
+    return [json.loads(line) for line in lines]
 
 
 def write_jsonl(path: Path, rows: list[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        for row in rows:
-            f.write(json.dumps(row, separators=(",", ":")) + "\n")
-    os.replace(tmp, path)
+    # A unique temp file per writer: concurrent rewrites (runner + agent CLI
+    # calls) must not share one .tmp path and rename each other's halves.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write("".join(encode_row(row) + "\n" for row in rows))
+        # mkstemp creates 0600 files; keep the store's existing permissions.
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def append_jsonl(path: Path, row: dict) -> None:
+    """Append a single row without rewriting the existing file."""
+    append_rows(path, [row])
+
+
+def append_rows(path: Path, rows: list[dict]) -> None:
+    """Append rows with one locked O_APPEND write.
+
+    One os.write() per batch of lines (under flock when available) avoids
+    interleaving when multiple processes append concurrently.
+    """
+    data = "".join(encode_row(row) + "\n" for row in rows).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # O_RDWR rather than O_WRONLY so the last byte can be checked with pread.
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    lock_impl = None
+    locked = False
+    try:
+        try:
+            import fcntl  # type: ignore
+
+            lock_impl = fcntl
+        except ImportError:
+            lock_impl = None
+
+        if lock_impl is not None:
+            lock_impl.flock(fd, lock_impl.LOCK_EX)
+            locked = True
+
+        # A hand-edited file may lack its final newline; without one the
+        # first appended row would be glued onto the last existing row.
+        size = os.fstat(fd).st_size
+        if size > 0 and os.pread(fd, 1, size - 1) != b"\n":
+            data = b"\n" + data
+
+        written = 0
+        while written < len(data):
+            n = os.write(fd, data[written:])
+            if n <= 0:
+                raise OSError(f"short write while appending to {path}")
+            written += n
+    finally:
+        if locked and lock_impl is not None:
+            try:
+                lock_impl.flock(fd, lock_impl.LOCK_UN)
+            except OSError:
+                pass
+        os.close(fd)
@@ -2,31 +2,51 @@
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 
 import yaml
 
+_FIRST_LINE_RE = re.compile(r"\S[^\n]*")
+_PLACEHOLDER_RE = re.compile(r"\{\{(PROMPT|ISSUE_ID|ROLES)\}\}")
+
+# Role prompts live here, relative to the repo root.
+_ROLES_REL_DIR = ".inshallah/roles"
+
+# path -> ((st_mtime_ns, st_size), frontmatter, body)
+_PROMPT_CACHE: dict[str, tuple[tuple[int, int], dict, str]] = {}
+# (repo root, role) -> .inshallah/roles/<role>.md
+_ROLE_PATHS: dict[tuple[Path, str], Path] = {}
+# repo root -> ([(file name, st_mtime_ns, st_size)], parsed roles)
+_ROLES_CACHE: dict[str, tuple[list, list]] = {}
+# repo root -> (parsed roles it was built from, markdown catalog)
+_CATALOG_CACHE: dict[str, tuple[list, str]] = {}
+
 
 def _split_frontmatter(text: str) -> tuple[dict, str]:
     """Split optional YAML frontmatter from markdown body."""
     if not text.startswith("---"):
         return {}, text
-    parts = text.split("---", 2)
-    if len(parts) < 3:
+    # Locate the closing fence and slice the body once, rather than splitting
+    # the whole file and then stripping a second copy of the body.
+    end = text.find("---", 3)
+    if end == -1:
         return {}, text
     try:
-        meta = yaml.safe_load(parts[1]) or {}
+        meta = yaml.safe_load(text[3:end]) or {}
     except yaml.YAMLError:
         return {}, text
-    return meta, parts[2].lstrip("\n")
+    start = end + 3
+    while text.startswith("\n", start):
+        start += 1
+    return meta, text[start:]
 
 
 def _first_non_empty_line(text: str) -> str:
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped:
-            return stripped
-    return ""
+    # Scan to the first non-blank character instead of splitting every line.
+    m = _FIRST_LINE_RE.search(text)
+    return m.group().rstrip() if m else ""
 
 
 def _extract_description(meta: dict, body: str) -> tuple[str, str]:
@@ -41,25 +61,101 @@ def _extract_description(meta: dict, body: str) -> tuple[str, str]:
     return "", "none"
 
 
+def _read_prompt(path: Path) -> tuple[dict, str]:
+    """Return (frontmatter, body) for a prompt file.
+
+    The split is cached per path and reused until the file's mtime or size
+    changes, so repeated config resolution and rendering do not re-read the
+    file or re-parse its YAML.
+    """
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    cached = _PROMPT_CACHE.get(key)
+    if cached is None or cached[0] != sig:
+        meta, body = _split_frontmatter(path.read_text())
+        cached = (sig, meta, body)
+        _PROMPT_CACHE[key] = cached
+    return cached[1], cached[2]
+
+
 def read_prompt_meta(path: str | Path) -> dict:
     """Read just the frontmatter metadata from a prompt file."""
-    text = Path(path).read_text()
-    meta, _ = _split_frontmatter(text)
-    return meta
+    meta, _ = _read_prompt(Path(path))
+    return dict(meta)
+
+
+def read_prompt_body(path: str | Path) -> str:
+    """Read a prompt file's body, without its frontmatter."""
+    _, body = _read_prompt(Path(path))
+    return body
+
+
+def role_prompt_path(repo_root: Path, role: str) -> Path:
+    """Return the prompt file path for *role*, memoized per repo root."""
+    key = (repo_root, role)
+    path = _ROLE_PATHS.get(key)
+    if path is None:
+        path = repo_root / _ROLES_REL_DIR / f"{role}.md"
+        _ROLE_PATHS[key] = path
+    return path
+
+
+def _scan_roles(repo_root: Path) -> list[tuple[str, str, dict, str, str]]:
+    """Parse .inshallah/roles/*.md into (name, prompt_path, meta, desc, desc_source).
+
+    The parsed roles are cached per repo and reused while every role file's
+    mtime and size are unchanged, so rendering ``{{ROLES}}`` on each DAG step
+    does not re-read and re-parse the whole roles directory.
+    """
+    roles_dir = repo_root / _ROLES_REL_DIR
+    # One directory read; DirEntry reuses the type/stat info it already has.
+    try:
+        with os.scandir(roles_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".md") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    sig = []
+    for entry in entries:
+        st = entry.stat()
+        sig.append((entry.name, st.st_mtime_ns, st.st_size))
+    key = str(repo_root)
+    cached = _ROLES_CACHE.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    # Only files whose signature changed are re-read; the rest keep their
+    # previous parse.
+    previous = dict(zip(cached[0], cached[1])) if cached is not None else {}
+    # Every role sits directly under roles_dir, so its repo-relative path is
+    # this fixed prefix plus the file name; no per-file relative_to().
+    rel_prefix = _ROLES_REL_DIR + "/"
+    roles = []
+    for entry, entry_sig in zip(entries, sig):
+        role = previous.get(entry_sig)
+        if role is not None:
+            roles.append(role)
+            continue
+        meta, body = _split_frontmatter(Path(entry.path).read_text())
+        desc, desc_source = _extract_description(meta, body)
+        name = entry.name
+        roles.append((name[:-3], rel_prefix + name, meta, desc, desc_source))
+    _ROLES_CACHE[key] = (sig, roles)
+    return roles
 
 
 def build_role_catalog(repo_root: Path) -> str:
     """Build a markdown catalog of available roles from .inshallah/roles/*.md."""
-    roles_dir = repo_root / ".inshallah" / "roles"
-    if not roles_dir.is_dir():
-        return ""
+    roles = _scan_roles(repo_root)
+    key = str(repo_root)
+    cached = _CATALOG_CACHE.get(key)
+    # _scan_roles returns the same list object until a role file changes.
+    if cached is not None and cached[0] is roles:
+        return cached[1]
     sections: list[str] = []
-    for path in sorted(roles_dir.glob("*.md")):
-        text = path.read_text()
-        meta, body = _split_frontmatter(text)
-        name = path.stem
-        prompt_path = path.relative_to(repo_root).as_posix()
-        desc, desc_source = _extract_description(meta, body)
+    for name, prompt_path, meta, desc, desc_source in roles:
         # Build config summary from frontmatter
         parts = []
         for key in ("cli", "model", "reasoning"):
@@ -74,45 +170,57 @@ def build_role_catalog(repo_root: Path) -> str:
             f"prompt: {prompt_path}\n"
             f"config: {config_line}"
         )
-    return "\n\n".join(sections)
+    catalog = "\n\n".join(sections)
+    _CATALOG_CACHE[key] = (roles, catalog)
+    return catalog
 
 
 def list_roles_json(repo_root: Path) -> list[dict]:
     """Return structured role data from .inshallah/roles/*.md."""
-    roles_dir = repo_root / ".inshallah" / "roles"
-    if not roles_dir.is_dir():
-        return []
-    result: list[dict] = []
-    for path in sorted(roles_dir.glob("*.md")):
-        text = path.read_text()
-        meta, body = _split_frontmatter(text)
-        desc, desc_source = _extract_description(meta, body)
-        result.append({
-            "name": path.stem,
-            "prompt_path": path.relative_to(repo_root).as_posix(),
+    return [
+        {
+            "name": name,
+            "prompt_path": prompt_path,
             "cli": meta.get("cli", ""),
             "model": meta.get("model", ""),
             "reasoning": meta.get("reasoning", ""),
             "description": desc,
             "description_source": desc_source,
-        })
-    return result
+        }
+        for name, prompt_path, meta, desc, desc_source in _scan_roles(repo_root)
+    ]
 
 
-def render(path: str | Path, issue: dict, *, repo_root: Path | None = None) -> str:
-    """Render a prompt template with issue data substituted."""
-    text = Path(path).read_text()
-    _, body = _split_frontmatter(text)
-
-    prompt_text = issue.get("title", "")
-    if issue.get("body"):
-        prompt_text += "\n\n" + issue["body"]
-
-    body = body.replace("{{PROMPT}}", prompt_text)
-    body = body.replace("{{ISSUE_ID}}", issue.get("id", ""))
+def issue_prompt_text(issue: dict) -> str:
+    """Return the issue title, followed by its body when it has one."""
+    title = issue.get("title", "")
+    body = issue.get("body")
+    return f"{title}\n\n{body}" if body else title
 
-    if "{{ROLES}}" in body:
-        catalog = build_role_catalog(repo_root) if repo_root else ""
-        body = body.replace("{{ROLES}}", catalog)
 
-    return body
+def render(path: str | Path, issue: dict, *, repo_root: Path | None = None) -> str:
+    """Render a prompt template with issue data substituted."""
+    return render_text(read_prompt_body(path), issue, repo_root=repo_root)
+
+
+def render_text(body: str, issue: dict, *, repo_root: Path | None = None) -> str:
+    """Substitute issue data into an already-read template body."""
+    values: dict[str, str] = {}
+
+    def _value(m: re.Match[str]) -> str:
+        name = m.group(1)
+        value = values.get(name)
+        if value is None:
+            # Computed on first use, so the role catalog is only built when
+            # the template references it.
+            if name == "PROMPT":
+                value = issue_prompt_text(issue)
+            elif name == "ISSUE_ID":
+                value = issue.get("id", "")
+            else:
+                value = build_role_catalog(repo_root) if repo_root else ""
+            values[name] = value
+        return value
+
+    # One pass over the template; substituted text is never re-scanned.
+    return _PLACEHOLDER_RE.sub(_value, body)
@@ -5,8 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+from .prompt import role_prompt_path
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ExecutionSpec:
     role: str | None = None
     prompt_path: str | None = None
@@ -21,7 +23,7 @@ class ExecutionSpec:
 
         # Auto-resolve prompt_path from role name
         if not prompt_path and role and repo_root:
-            candidate = repo_root / ".inshallah" / "roles" / f"{role}.md"
+            candidate = role_prompt_path(repo_root, role)
             if candidate.exists():
                 prompt_path = str(candidate)
 
@@ -174,6 +174,30 @@ def test_gemini_run_maps_result_failure_to_nonzero_exit() -> None:
     assert on_line.call_count == 2
 
 
+def test_run_waits_for_exit_after_stdout_eof() -> None:
+    backend = PiBackend()
+
+    with patch("inshallah.backend.subprocess.Popen") as mock_popen:
+        proc = MagicMock()
+        proc.stdout = MagicMock()
+        proc.stdout.readline.side_effect = ["line\n", ""]
+        # Process still running when stdout closes: must not spin on poll().
+        proc.poll.return_value = None
+        proc.wait.return_value = 0
+        mock_popen.return_value = proc
+
+        rc = backend.run(
+            "Implement this issue end-to-end.",
+            "openai/gpt-5",
+            "high",
+            Path("/tmp/workspace"),
+        )
+
+    assert rc == 0
+    assert proc.stdout.readline.call_count == 2
+    proc.wait.assert_called_once_with()
+
+
 def test_unknown_backend_error_lists_opencode_pi_and_gemini() -> None:
     with pytest.raises(ValueError) as exc:
         get_backend("unknown")
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from inshallah.cli import cmd_forum
+from inshallah.forum_store import ForumStore
 
 
 def _setup(tmp_path: Path) -> None:
@@ -56,6 +57,32 @@ class TestPostRead:
         assert rc == 0
         assert {row["topic"] for row in out} == {"issue:a", "issue:b"}
 
+    def test_read_limit_keeps_newest_messages(self, tmp_path: Path) -> None:
+        store = ForumStore.from_workdir(tmp_path)
+        for body in ("one", "two", "three"):
+            store.post("issue:a", body)
+            store.post("issue:b", body)
+
+        assert [m["body"] for m in store.read("issue:a", limit=2)] == ["two", "three"]
+        assert [m["body"] for m in store.read("issue:a", limit=0)] == ["one", "two", "three"]
+
+    def test_read_ignores_topic_mentioned_in_other_bodies(self, tmp_path: Path) -> None:
+        store = ForumStore.from_workdir(tmp_path)
+        store.post("issue:a", "hello")
+        store.post("issue:b", 'see "issue:a"')
+        store.post("issue:ab", "other")
+
+        assert [m["body"] for m in store.read("issue:a")] == ["hello"]
+
+    def test_topics_limit_keeps_most_recent(self, tmp_path: Path) -> None:
+        store = ForumStore.from_workdir(tmp_path)
+        for topic, ts in (("a", 3), ("b", 1), ("c", 2)):
+            with patch("inshallah.forum_store.now_ts", return_value=ts):
+                store.post(topic, "msg")
+
+        assert [t["topic"] for t in store.topics(limit=2)] == ["a", "c"]
+        assert [t["topic"] for t in store.topics()] == ["a", "c", "b"]
+
 
 class TestDispatcher:
     def test_no_args(self, tmp_path: Path, capsys) -> None:
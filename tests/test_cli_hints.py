@@ -180,6 +180,21 @@ def test_resume_json_emits_only_json_payload(tmp_path: Path, capsys) -> None:
     assert "Next Steps" not in raw
 
 
+def test_resume_accepts_unique_id_prefix(tmp_path: Path, capsys) -> None:
+    _setup_repo(tmp_path)
+    store = IssueStore(tmp_path / ".inshallah" / "issues.jsonl")
+    root = store.create("root", tags=["node:agent", "node:root"])
+
+    with (
+        patch("inshallah.cli._find_repo_root", return_value=tmp_path),
+        patch("inshallah.cli.DagRunner.run", return_value=DagResult(status="root_final", steps=1, error="")),
+    ):
+        rc = cmd_resume([root["id"][:-2], "--json"], Console())
+
+    assert rc == 0
+    assert json.loads(capsys.readouterr().out)["root_id"] == root["id"]
+
+
 def test_resume_missing_root_json_has_recovery(tmp_path: Path, capsys) -> None:
     _setup_repo(tmp_path)
 
@@ -352,6 +352,22 @@ class TestReady:
         assert a["id"] in ids
         assert b["id"] not in ids
 
+    def test_priority_then_creation_order(self, tmp_path: Path, capsys) -> None:
+        _setup(tmp_path)
+        from inshallah.store import IssueStore
+        store = IssueStore(tmp_path / ".inshallah" / "issues.jsonl")
+        root = store.create("root", tags=["node:agent", "node:root"])
+        kids = [
+            store.create(title, tags=["node:agent"], priority=priority)
+            for title, priority in (("c", 3), ("a", 1), ("d", 3), ("b", 1))
+        ]
+        for kid in kids:
+            store.add_dep(kid["id"], "parent", root["id"])
+
+        rc, out = _run(tmp_path, ["ready", "--root", root["id"]], capsys)
+        assert rc == 0
+        assert [i["title"] for i in out] == ["a", "b", "c", "d"]
+
 
 # -- children/validate ------------------------------------------------------
 
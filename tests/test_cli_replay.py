@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -20,6 +21,24 @@ def test_replay_help_mentions_gemini_backend(tmp_path: Path) -> None:
     assert "--backend codex|claude|opencode|pi|gemini" in rendered
 
 
+def test_replay_help_lists_ten_newest_logs(tmp_path: Path) -> None:
+    logs_dir = tmp_path / ".inshallah" / "logs"
+    logs_dir.mkdir(parents=True)
+    for i in range(12):
+        log = logs_dir / f"run-{i:02d}.jsonl"
+        log.write_text("{}\n")
+        os.utime(log, (1_000 + i, 1_000 + i))
+    console = Console(record=True, width=200)
+
+    with patch("inshallah.cli._find_repo_root", return_value=tmp_path):
+        rc = cmd_replay([], console)
+
+    assert rc == 0
+    rendered = console.export_text()
+    assert rendered.index("run-11") < rendered.index("run-02")
+    assert "run-01" not in rendered and "run-00" not in rendered
+
+
 def test_replay_uses_gemini_formatter(tmp_path: Path) -> None:
     logs_dir = tmp_path / ".inshallah" / "logs"
     logs_dir.mkdir(parents=True)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from inshallah.dag import DagRunner
 from inshallah.store import ForumStore, IssueStore
 
@@ -277,3 +279,120 @@ class TestAutoPromotion:
         assert updated is not None
         assert updated["outcome"] == "success"
         assert result.status == "root_final"
+
+
+class TestClaim:
+    def test_selected_issue_is_claimed_before_execution(self, tmp_path: Path) -> None:
+        """The runner's selection is already in_progress when the backend runs."""
+        store, forum = _setup_stores(tmp_path)
+        issue = store.create("test task", tags=["node:agent", "node:root"])
+
+        runner = DagRunner(store, forum, tmp_path)
+        seen_status: list[str] = []
+
+        def fake_run(*args, **kwargs):
+            seen_status.append(store.get(issue["id"])["status"])
+            store.close(issue["id"], outcome="success")
+            return 0
+
+        with patch("inshallah.dag.get_backend") as mock_backend, \
+             patch("inshallah.dag.get_formatter") as mock_formatter:
+            mock_proc = MagicMock()
+            mock_proc.run.side_effect = fake_run
+            mock_backend.return_value = mock_proc
+            mock_formatter.return_value = MagicMock()
+
+            runner.run(issue["id"], max_steps=1)
+
+        assert seen_status == ["in_progress"]
+
+    def test_claim_next_skips_non_ready_issues(self, tmp_path: Path) -> None:
+        store, _ = _setup_stores(tmp_path)
+        root = store.create("root", tags=["node:agent", "node:root"])
+        child = store.create("child", tags=["node:agent"])
+        store.add_dep(child["id"], "parent", root["id"])
+
+        claimed = store.claim_next(root["id"], tags=["node:agent"])
+        assert claimed is not None
+        assert claimed["id"] == child["id"]
+        assert store.get(child["id"])["status"] == "in_progress"
+        assert store.claim_next(root["id"], tags=["node:agent"]) is None
+
+
+class TestUnstick:
+    def test_failed_leaf_is_reopened_and_rerun(self, tmp_path: Path) -> None:
+        store, forum = _setup_stores(tmp_path)
+        root = store.create("root", tags=["node:agent", "node:root"])
+        child = store.create("child", tags=["node:agent"])
+        store.add_dep(child["id"], "parent", root["id"])
+        store.close(root["id"], outcome="expanded")
+        store.close(child["id"], outcome="failure")
+
+        runner = DagRunner(store, forum, tmp_path)
+        ran: list[str] = []
+
+        def fake_run(prompt, *args, **kwargs):
+            ran.append(prompt)
+            store.close(child["id"], outcome="success")
+            return 0
+
+        with patch("inshallah.dag.get_backend") as mock_backend, \
+             patch("inshallah.dag.get_formatter") as mock_formatter:
+            mock_proc = MagicMock()
+            mock_proc.run.side_effect = fake_run
+            mock_backend.return_value = mock_proc
+            mock_formatter.return_value = MagicMock()
+
+            runner.run(root["id"], max_steps=1)
+
+        assert len(ran) == 1
+        assert f"Assigned issue: {child['id']}" in ran[0]
+        assert store.get(child["id"])["outcome"] == "success"
+
+
+class TestFormatPath:
+    def test_inside_and_outside_repo(self, tmp_path: Path) -> None:
+        store, forum = _setup_stores(tmp_path)
+        runner = DagRunner(store, forum, tmp_path)
+        inside = tmp_path / ".inshallah" / "logs" / "x.jsonl"
+        assert runner._format_path(inside) == str(Path(".inshallah") / "logs" / "x.jsonl")
+        outside = tmp_path.parent / "elsewhere.jsonl"
+        assert runner._format_path(outside) == str(outside)
+
+
+class TestLogsDir:
+    def test_logs_dir_recreated_if_removed_between_runs(self, tmp_path: Path) -> None:
+        store, forum = _setup_stores(tmp_path)
+        issue = store.create("task", tags=["node:agent"])
+        runner = DagRunner(store, forum, tmp_path)
+        logs_dir = tmp_path / ".inshallah" / "logs"
+
+        with patch("inshallah.dag.get_backend") as mock_backend, \
+             patch("inshallah.dag.get_formatter") as mock_formatter:
+            mock_backend.return_value.run.return_value = 0
+            mock_formatter.return_value = MagicMock()
+
+            runner._execute_backend(issue, "codex", "m", "r", None, issue["id"])
+            logs_dir.rmdir()
+            runner._execute_backend(issue, "codex", "m", "r", None, issue["id"])
+
+        assert logs_dir.is_dir()
+
+
+class TestRenderPrompt:
+    def test_missing_template_falls_back_to_issue_text(self, tmp_path: Path) -> None:
+        store, forum = _setup_stores(tmp_path)
+        runner = DagRunner(store, forum, tmp_path)
+        prompt, _ = runner._render_prompt({"id": "x", "title": "T"}, str(tmp_path / "missing.md"), "x")
+        assert prompt == "T"
+
+    def test_role_catalog_errors_propagate(self, tmp_path: Path) -> None:
+        store, forum = _setup_stores(tmp_path)
+        _write_orchestrator(tmp_path, "cli: codex\n", "{{PROMPT}}\n{{ROLES}}\n")
+        runner = DagRunner(store, forum, tmp_path)
+
+        with patch("inshallah.prompt._scan_roles", side_effect=FileNotFoundError("role.md")):
+            with pytest.raises(FileNotFoundError):
+                runner._render_prompt(
+                    {"id": "x", "title": "T"}, str(tmp_path / ".inshallah" / "orchestrator.md"), "x"
+                )
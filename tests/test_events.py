@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from inshallah.dag import DagRunner
+from inshallah.events import EventLog
 from inshallah.jsonl import read_jsonl
 from inshallah.store import ForumStore, IssueStore
 
@@ -117,3 +118,19 @@ def test_dag_runner_emits_correlated_events(tmp_path: Path) -> None:
     assert "backend.run.start" in types
     assert "backend.run.end" in types
 
+
+def test_emit_many_appends_batch_in_order(tmp_path: Path) -> None:
+    lf = _setup_store_dir(tmp_path)
+    log = EventLog(lf / "events.jsonl")
+    log.emit("first", source="test")
+    log.emit_many([
+        log.build("second", source="test", issue_id="inshallah-1"),
+        log.build("third", source="test", payload={"n": 3}),
+    ])
+
+    events = _read_events(lf)
+    for ev in events:
+        _assert_envelope(ev)
+    assert [ev["type"] for ev in events] == ["first", "second", "third"]
+    assert events[1]["issue_id"] == "inshallah-1"
+    assert events[2]["payload"] == {"n": 3}
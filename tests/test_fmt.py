@@ -1068,6 +1068,15 @@ def test_normalize_tool_names() -> None:
     assert _normalize_tool("unknown_tool") == "unknown_tool"
 
 
+def test_strip_shell_unwraps_and_drops_cd_prefix() -> None:
+    from inshallah.fmt import _strip_shell
+
+    assert _strip_shell("/bin/zsh -lc 'cd /repo && ls -la'") == "ls -la"
+    assert _strip_shell("cd src && pytest -q") == "pytest -q"
+    assert _strip_shell("cdk deploy") == "cdk deploy"
+    assert _strip_shell("echo 'cd x && y'") == "echo 'cd x && y'"
+
+
 # -- Color-coding --
 
 
@@ -0,0 +1,105 @@
+"""Tests for low-level JSONL storage helpers."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from inshallah.jsonl import append_jsonl, read_jsonl, write_jsonl
+from inshallah.store import ForumStore, IssueStore
+
+
+def test_append_preserves_existing_rows(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    write_jsonl(path, [{"a": 1}, {"a": 2}])
+    before = path.read_bytes()
+
+    append_jsonl(path, {"a": 3})
+
+    assert path.read_bytes().startswith(before)
+    assert read_jsonl(path) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+def test_append_creates_missing_file(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "rows.jsonl"
+    append_jsonl(path, {"a": 1})
+    assert read_jsonl(path) == [{"a": 1}]
+
+
+def test_read_skips_blank_lines_and_reports_bad_rows(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"a":1}\n\n  \n{"a":[2,3]}\n')
+    assert read_jsonl(path) == [{"a": 1}, {"a": [2, 3]}]
+
+    path.write_text('{"a":1}\n{"a":\n')
+    with pytest.raises(json.JSONDecodeError) as exc:
+        read_jsonl(path)
+    assert exc.value.doc == '{"a":'
+
+
+def test_read_rejects_rows_that_only_decode_when_joined(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    for text in (
+        '{"id":"a","status":"open"\n"title":"x"}\n',
+        '{"a":1}\n1,2\n',
+        '{"a":1},{"b":2}\n{"c":3\n"d":4}\n',
+    ):
+        path.write_text(text)
+        with pytest.raises(json.JSONDecodeError):
+            read_jsonl(path)
+
+
+def test_forum_post_after_missing_final_newline(tmp_path: Path) -> None:
+    forum = ForumStore(tmp_path / ".inshallah" / "forum.jsonl")
+    forum.post("issue:a", "one")
+    forum.path.write_bytes(forum.path.read_bytes().rstrip(b"\n"))
+
+    forum.post("issue:a", "two")
+
+    assert [msg["body"] for msg in forum.read("issue:a")] == ["one", "two"]
+
+
+def test_forum_post_appends_without_rewrite(tmp_path: Path) -> None:
+    forum = ForumStore(tmp_path / ".inshallah" / "forum.jsonl")
+    forum.post("issue:a", "one")
+    before = forum.path.read_bytes()
+
+    forum.post("issue:a", "two")
+
+    assert forum.path.read_bytes().startswith(before)
+    assert [msg["body"] for msg in forum.read("issue:a")] == ["one", "two"]
+
+
+def test_issue_create_appends_without_rewrite(tmp_path: Path) -> None:
+    store = IssueStore(tmp_path / ".inshallah" / "issues.jsonl")
+    first = store.create("one")
+    before = store.path.read_bytes()
+
+    second = store.create("two")
+
+    assert store.path.read_bytes().startswith(before)
+    assert [row["id"] for row in store.list()] == [first["id"], second["id"]]
+
+
+def test_issue_create_after_missing_final_newline(tmp_path: Path) -> None:
+    store = IssueStore(tmp_path / ".inshallah" / "issues.jsonl")
+    first = store.create("one")
+    store.path.write_bytes(store.path.read_bytes().rstrip(b"\n"))
+
+    second = store.create("two")
+
+    assert [row["id"] for row in store.list()] == [first["id"], second["id"]]
+
+
+def test_write_replaces_atomically_without_leftovers(tmp_path: Path) -> None:
+    path = tmp_path / "rows.jsonl"
+    write_jsonl(path, [{"a": 1}])
+    path.chmod(0o640)
+
+    write_jsonl(path, [{"a": 2}, {"a": 3}])
+
+    assert read_jsonl(path) == [{"a": 2}, {"a": 3}]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["rows.jsonl"]
+    assert path.stat().st_mode & 0o777 == 0o640
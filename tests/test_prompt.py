@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
-from inshallah.prompt import build_role_catalog, list_roles_json, render
+from inshallah.prompt import build_role_catalog, list_roles_json, read_prompt_meta, render
 
 
 def _write_role(tmp_path: Path, name: str, frontmatter: str, body: str) -> None:
@@ -67,6 +68,32 @@ class TestBuildRoleCatalog:
         assert "description_source: frontmatter" in catalog
         assert "description: Body line should not be used." not in catalog
 
+    def test_reuses_parsed_roles_while_unchanged(self, tmp_path: Path) -> None:
+        _write_role(tmp_path, "worker", "cli: codex\n", "Worker description.\n")
+        catalog = build_role_catalog(tmp_path)
+
+        with patch("inshallah.prompt._split_frontmatter") as split:
+            assert build_role_catalog(tmp_path) == catalog
+            assert list_roles_json(tmp_path)[0]["cli"] == "codex"
+            split.assert_not_called()
+
+    def test_rescans_after_role_added(self, tmp_path: Path) -> None:
+        _write_role(tmp_path, "worker", "cli: codex\n", "Worker description.\n")
+        assert "### reviewer" not in build_role_catalog(tmp_path)
+
+        _write_role(tmp_path, "reviewer", "cli: claude\n", "Reviewer description.\n")
+        assert "### reviewer" in build_role_catalog(tmp_path)
+
+    def test_rescan_only_parses_changed_roles(self, tmp_path: Path) -> None:
+        _write_role(tmp_path, "worker", "cli: codex\n", "Worker description.\n")
+        build_role_catalog(tmp_path)
+        _write_role(tmp_path, "reviewer", "cli: claude\n", "Reviewer description.\n")
+
+        with patch("inshallah.prompt._split_frontmatter", return_value=({}, "Reviewer.\n")) as split:
+            catalog = build_role_catalog(tmp_path)
+        assert split.call_count == 1
+        assert "Worker description." in catalog
+
 
 class TestListRolesJson:
     def test_description_source_frontmatter(self, tmp_path: Path) -> None:
@@ -94,6 +121,31 @@ class TestListRolesJson:
         assert roles[0]["description_source"] == "body"
 
 
+class TestReadPromptMeta:
+    def test_reuses_parsed_meta_while_unchanged(self, tmp_path: Path) -> None:
+        prompt = tmp_path / "role.md"
+        prompt.write_text("---\ncli: codex\n---\nBody\n")
+        assert read_prompt_meta(prompt) == {"cli": "codex"}
+
+        with patch("inshallah.prompt._split_frontmatter") as split:
+            assert read_prompt_meta(prompt) == {"cli": "codex"}
+            split.assert_not_called()
+
+    def test_rereads_after_change(self, tmp_path: Path) -> None:
+        prompt = tmp_path / "role.md"
+        prompt.write_text("---\ncli: codex\n---\nBody\n")
+        assert read_prompt_meta(prompt)["cli"] == "codex"
+
+        prompt.write_text("---\ncli: claude\nmodel: opus\n---\nBody\n")
+        assert read_prompt_meta(prompt) == {"cli": "claude", "model": "opus"}
+
+    def test_tab_after_value_is_not_frontmatter(self, tmp_path: Path) -> None:
+        # PyYAML's pure-Python SafeLoader rejects this; libyaml would accept it.
+        prompt = tmp_path / "role.md"
+        prompt.write_text("---\ncli: codex\t\nmodel: x\n---\nBody\n")
+        assert read_prompt_meta(prompt) == {}
+
+
 class TestRender:
     def test_basic_substitution(self, tmp_path: Path) -> None:
         prompt = tmp_path / "test.md"
@@ -127,3 +179,21 @@ class TestRender:
         prompt.write_text("{{PROMPT}}\n")
         result = render(prompt, {"title": "Title", "body": "Details"})
         assert "Title\n\nDetails" in result
+
+    def test_reuses_template_while_unchanged(self, tmp_path: Path) -> None:
+        prompt = tmp_path / "test.md"
+        prompt.write_text("---\ncli: claude\n---\nDo {{PROMPT}}\n")
+        assert render(prompt, {"title": "a"}) == "Do a\n"
+
+        with patch("inshallah.prompt._split_frontmatter") as split:
+            assert render(prompt, {"title": "b"}) == "Do b\n"
+            split.assert_not_called()
+
+        prompt.write_text("---\ncli: claude\n---\nRedo {{PROMPT}}\n")
+        assert render(prompt, {"title": "c"}) == "Redo c\n"
+
+    def test_substituted_text_is_not_re_expanded(self, tmp_path: Path) -> None:
+        prompt = tmp_path / "test.md"
+        prompt.write_text("{{ISSUE_ID}}: {{PROMPT}}\n")
+        result = render(prompt, {"id": "inshallah-1", "title": "literal {{ISSUE_ID}}"})
+        assert result == "inshallah-1: literal {{ISSUE_ID}}\n"
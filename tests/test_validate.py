@@ -44,6 +44,7 @@ class TestValidateBasic:
         v = store.validate(root["id"])
         assert v.is_final is False
         assert "needs work" in v.reason
+        assert v.needs_reorchestration is True
 
 
 class TestValidateExpanded: